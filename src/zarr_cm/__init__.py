@@ -6,160 +6,197 @@ zarr-cm: Python implementation of Zarr Conventions Metadata
 
 from __future__ import annotations
 
+import functools
+import importlib
 import typing
-from collections.abc import Sequence
-from typing import Final, Literal, NamedTuple, NotRequired
+from typing import Final, Literal, NamedTuple
 
-from typing_extensions import TypedDict
-
-if typing.TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
-
-from . import license as license_
-from . import multiscales, proj, spatial, uom
 from ._core import (
     ConventionAttrs,
     ConventionMetadataObject,
     JsonDict,
     JsonValue,
+    check_json_object,
+    insert_many_conventions,
     validate_convention_metadata_object,
     validate_convention_metadata_objects,
-    validate_json_object,
 )
 from ._version import version as __version__
-from .geo_proj import (
-    GeoProjAttrs,
-    GeoProjAttrsR2,
-    GeoProjAttrsR3,
-    GeoProjConventionAttrs,
-    GeoProjConventionAttrsR2,
-    GeoProjConventionAttrsR3,
-)
-from .license import LicenseAttrs, LicenseConventionAttrs
-from .multiscales import (
-    LayoutObject,
-    LayoutObjectR2,
-    MultiscalesAttrs,
-    MultiscalesAttrsR2,
-    MultiscalesConventionAttrs,
-    MultiscalesConventionAttrsR2,
-    Transform,
-    TransformR2,
-)
-from .spatial import (
-    SpatialAttrs,
-    SpatialAttrsR2,
-    SpatialAttrsR3,
-    SpatialConventionAttrs,
-    SpatialConventionAttrsR2,
-    SpatialConventionAttrsR3,
-)
-from .uom import UCUM, UomAttrs, UomConventionAttrs
+
+# The convention packages and their re-exported types are loaded lazily via
+# PEP 562 module ``__getattr__`` below, so ``import zarr_cm`` pays only for
+# ``_core``. These imports exist for type checkers, which do not execute
+# ``__getattr__``; the runtime lookup resolves the same objects.
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    # Redundant aliases mark the submodules as intentional re-exports.
+    from . import geo_proj as geo_proj
+    from . import license as license
+    from . import multiscales as multiscales
+    from . import proj as proj
+    from . import spatial as spatial
+    from . import uom as uom
+    from ._multi_attrs import MultiConventionAttrs
+    from .license import LicenseAttrs, LicenseConventionAttrs
+    from .multiscales import (
+        LayoutObject,
+        LayoutObjectR2,
+        MultiscalesAttrs,
+        MultiscalesAttrsR2,
+        MultiscalesConventionAttrs,
+        MultiscalesConventionAttrsR2,
+        Transform,
+        TransformR2,
+    )
+    from .proj import (
+        GeoProjAttrs,
+        GeoProjAttrsR2,
+        GeoProjAttrsR3,
+        GeoProjConventionAttrs,
+        GeoProjConventionAttrsR2,
+        GeoProjConventionAttrsR3,
+    )
+    from .spatial import (
+        SpatialAttrs,
+        SpatialAttrsR2,
+        SpatialAttrsR3,
+        SpatialConventionAttrs,
+        SpatialConventionAttrsR2,
+        SpatialConventionAttrsR3,
+    )
+    from .uom import UCUM, UomAttrs, UomConventionAttrs
+
+    ALL_CONVENTION_KEYS: Final[frozenset[str]]
 
 ConventionName = Literal["geo-proj", "spatial", "multiscales", "license", "uom"]
 
 
 class _ConventionModule(NamedTuple):
     UUID: str
-    CONVENTION_KEYS: set[str]
+    CONVENTION_KEYS: frozenset[str]
     validate: typing.Callable[..., object]
+    validate_attrs: typing.Callable[..., None]
     insert: typing.Callable[..., JsonDict]
+    insert_item: typing.Callable[
+        ..., tuple[ConventionMetadataObject, Mapping[str, JsonValue]]
+    ]
     extract: typing.Callable[..., tuple[JsonDict, object]]
     detect: typing.Callable[[Mapping[str, JsonValue]], str | None]
     resolve_read_revision: (
         typing.Callable[[Mapping[str, JsonValue], str | None], str] | None
     ) = None
-
-
-_REGISTRY: Final[dict[ConventionName, _ConventionModule]] = {
-    "geo-proj": _ConventionModule(
-        proj.UUID,
-        proj.CONVENTION_KEYS,
-        proj.validate,
-        proj.insert,
-        proj.extract,
-        proj.detect,
-        proj._resolve_read_revision,  # pylint: disable=protected-access
-    ),
-    "spatial": _ConventionModule(
-        spatial.UUID,
-        spatial.CONVENTION_KEYS,
-        spatial.validate,
-        spatial.insert,
-        spatial.extract,
-        spatial.detect,
-        spatial._resolve_read_revision,  # pylint: disable=protected-access
-    ),
-    "multiscales": _ConventionModule(
-        multiscales.UUID,
-        multiscales.CONVENTION_KEYS,
-        multiscales.validate,
-        multiscales.insert,
-        multiscales.extract,
-        multiscales.detect,
-        multiscales._resolve_read_revision,  # pylint: disable=protected-access
-    ),
-    "license": _ConventionModule(
-        license_.UUID,
-        license_.CONVENTION_KEYS,
-        license_.validate,
-        license_.insert,
-        license_.extract,
-        license_.detect,
-    ),
-    "uom": _ConventionModule(
-        uom.UUID,
-        uom.CONVENTION_KEYS,
-        uom.validate,
-        uom.insert,
-        uom.extract,
-        uom.detect,
-    ),
+    # Inverse of the package's _SCHEMA_URL_BY_REVISION plus its LATEST label,
+    # for resolving a claimed revision straight from an already-normalized CMO
+    # without re-scanning zarr_conventions. None for unrevisioned modules.
+    revision_by_schema_url: Mapping[str, str] | None = None
+    latest_revision: str | None = None
+
+
+# Display name -> submodule implementing the convention. ``geo-proj`` is the
+# historical display name; the package was renamed ``proj``.
+_MODULE_BY_NAME: Final[dict[ConventionName, str]] = {
+    "geo-proj": "proj",
+    "spatial": "spatial",
+    "multiscales": "multiscales",
+    "license": "license",
+    "uom": "uom",
 }
 
-CONVENTION_NAMES: Final = frozenset(_REGISTRY)
+CONVENTION_NAMES: Final = frozenset(_MODULE_BY_NAME)
+
+# Preformatted once: the unknown-name error path should not pay to sort and
+# render the (constant) name list on every miss.
+_VALID_NAMES_STR: Final = str(sorted(CONVENTION_NAMES))
+
+# Names resolvable via module ``__getattr__`` -> submodule that defines them.
+_LAZY_EXPORTS: Final[dict[str, str]] = {
+    "GeoProjAttrs": "proj",
+    "GeoProjAttrsR2": "proj",
+    "GeoProjAttrsR3": "proj",
+    "GeoProjConventionAttrs": "proj",
+    "GeoProjConventionAttrsR2": "proj",
+    "GeoProjConventionAttrsR3": "proj",
+    "SpatialAttrs": "spatial",
+    "SpatialAttrsR2": "spatial",
+    "SpatialAttrsR3": "spatial",
+    "SpatialConventionAttrs": "spatial",
+    "SpatialConventionAttrsR2": "spatial",
+    "SpatialConventionAttrsR3": "spatial",
+    "LayoutObject": "multiscales",
+    "LayoutObjectR2": "multiscales",
+    "MultiscalesAttrs": "multiscales",
+    "MultiscalesAttrsR2": "multiscales",
+    "MultiscalesConventionAttrs": "multiscales",
+    "MultiscalesConventionAttrsR2": "multiscales",
+    "Transform": "multiscales",
+    "TransformR2": "multiscales",
+    "LicenseAttrs": "license",
+    "LicenseConventionAttrs": "license",
+    "UCUM": "uom",
+    "UomAttrs": "uom",
+    "UomConventionAttrs": "uom",
+    "MultiConventionAttrs": "_multi_attrs",
+}
 
-ALL_CONVENTION_KEYS: Final = frozenset(
-    proj.CONVENTION_KEYS
-    | spatial.CONVENTION_KEYS
-    | multiscales.CONVENTION_KEYS
-    | license_.CONVENTION_KEYS
-    | uom.CONVENTION_KEYS
+_SUBMODULES: Final = frozenset(
+    {"geo_proj", "license", "multiscales", "proj", "spatial", "uom"}
 )
 
-MultiConventionAttrs = TypedDict(
-    "MultiConventionAttrs",
-    {
-        "zarr_conventions": NotRequired[Sequence[ConventionMetadataObject]],
-        # geo-proj
-        "proj:code": NotRequired[str],
-        "proj:wkt2": NotRequired[str],
-        "proj:projjson": NotRequired[JsonDict],
-        # spatial
-        "spatial:dimensions": NotRequired[Sequence[str]],
-        "spatial:bbox": NotRequired[Sequence[float]],
-        "spatial:transform_type": NotRequired[str],
-        "spatial:transform": NotRequired[Sequence[float]],
-        "spatial:shape": NotRequired[Sequence[int]],
-        "spatial:registration": NotRequired[str],
-        # multiscales
-        "multiscales": NotRequired[MultiscalesAttrs],
-        # license
-        "license": NotRequired[LicenseAttrs],
-        # uom
-        "uom": NotRequired[UomAttrs],
-    },
-    extra_items=JsonValue,
-)
+
+def __getattr__(name: str) -> object:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    source = _LAZY_EXPORTS.get(name)
+    if source is not None:
+        value = getattr(importlib.import_module(f".{source}", __name__), name)
+        globals()[name] = value  # cache so __getattr__ runs once per name
+        return value
+    if name == "ALL_CONVENTION_KEYS":
+        value = frozenset().union(
+            *(_get_module(n).CONVENTION_KEYS for n in CONVENTION_NAMES)
+        )
+        globals()[name] = value
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_SUBMODULES})
+
+
+@functools.cache
 def _get_module(name: ConventionName) -> _ConventionModule:
-    """Look up convention module by display name, raise ValueError if unknown."""
-    try:
-        return _REGISTRY[name]
-    except KeyError:
-        msg = f"Unknown convention {name!r}. Valid names: {sorted(CONVENTION_NAMES)}"
+    """Look up convention module by display name, raise ValueError if unknown.
+
+    Imports the convention's submodule on first use and caches the resulting
+    function table, so each convention is only paid for when dispatched to.
+    """
+    module_name = _MODULE_BY_NAME.get(name)
+    if module_name is None:
+        msg = f"Unknown convention {name!r}. Valid names: {_VALID_NAMES_STR}"
         raise ValueError(msg) from None
+    mod = importlib.import_module(f".{module_name}", __name__)
+    return _ConventionModule(
+        mod.UUID,
+        mod.CONVENTION_KEYS,
+        mod.validate,
+        mod.validate_attrs,
+        mod.insert,
+        mod._insert_item,  # pylint: disable=protected-access
+        mod.extract,
+        mod.detect,
+        getattr(mod, "_resolve_read_revision", None),
+        getattr(mod, "_REVISION_BY_SCHEMA_URL", None),
+        getattr(mod, "LATEST", None),
+    )
+
+
+@functools.cache
+def _uuid_to_name() -> dict[str, ConventionName]:
+    """Inverse map from convention UUID to display name (built on first read)."""
+    return {_get_module(name).UUID: name for name in CONVENTION_NAMES}
 
 
 def _rev_kwargs(
@@ -202,9 +239,51 @@ def _read_rev_kwargs(
 
 def _detect_conventions(attrs: Mapping[str, JsonValue]) -> frozenset[ConventionName]:
     """Identify which conventions are present by matching UUIDs in zarr_conventions."""
-    conventions = validate_convention_metadata_objects(attrs.get("zarr_conventions"))
-    uuids = {cmo.get("uuid") for cmo in conventions}
-    return frozenset(name for name, mod in _REGISTRY.items() if mod.UUID in uuids)
+    raw = attrs.get("zarr_conventions")
+    if raw is None:
+        # Nothing claimed: skip normalization and the UUID-map build (which
+        # imports every convention module on first use).
+        return frozenset()
+    conventions = validate_convention_metadata_objects(raw)
+    uuid_to_name = _uuid_to_name()
+    return frozenset(
+        name
+        for cmo in conventions
+        if (name := uuid_to_name.get(cmo.get("uuid", ""))) is not None
+    )
+
+
+def _detect_pinned(
+    attrs: Mapping[str, JsonValue],
+) -> tuple[frozenset[ConventionName], dict[ConventionName, str]]:
+    """Detect present conventions and pin their claimed revisions in one pass.
+
+    Per-convention revision detection re-normalizes ``zarr_conventions`` for
+    every revisioned module; for the ``*_all`` entry points the list is walked
+    once here instead, resolving each revisioned convention's label from its
+    own CMO (falling back to the module's latest, as on the per-module path).
+    """
+    raw = attrs.get("zarr_conventions")
+    if raw is None:
+        return frozenset(), {}
+    conventions = validate_convention_metadata_objects(raw)
+    uuid_to_name = _uuid_to_name()
+    names: set[ConventionName] = set()
+    pinned: dict[ConventionName, str] = {}
+    for cmo in conventions:
+        name = uuid_to_name.get(cmo.get("uuid", ""))
+        if name is None:
+            continue
+        names.add(name)
+        mod = _get_module(name)
+        if (
+            mod.revision_by_schema_url is not None
+            and mod.latest_revision is not None
+            and name not in pinned
+        ):
+            label = mod.revision_by_schema_url.get(cmo.get("schema_url", ""))
+            pinned[name] = label if label is not None else mod.latest_revision
+    return frozenset(names), pinned
 
 
 def create_many(
@@ -230,12 +309,27 @@ def create_many(
         A new attributes dict containing all convention data and a
         combined ``zarr_conventions`` array.
     """
+    # Reject unknown names before validating any payload, so a bad name at
+    # the end of the mapping does not waste the work done for earlier entries.
+    unknown = conventions.keys() - CONVENTION_NAMES
+    if unknown:
+        msg = f"Unknown convention {min(unknown)!r}. Valid names: {_VALID_NAMES_STR}"
+        raise ValueError(msg)
+    # Unlike insert_many there is no pre-existing attrs dict, so collision
+    # checks and dedup against prior zarr_conventions entries cannot apply:
+    # build the result directly. *conventions* is a mapping, so each
+    # convention -- and therefore each CMO -- appears at most once.
     result: JsonDict = {}
+    cmos: list[ConventionMetadataObject] = []
     for name, data in conventions.items():
         mod = _get_module(name)
         rk = _rev_kwargs(mod, revisions, name)
         mod.validate(data, **rk)
-        result = mod.insert(result, data, overwrite=True, **rk)
+        cmo, payload = mod.insert_item(data, **rk)
+        result.update(payload)
+        cmos.append(cmo)
+    if cmos:
+        result["zarr_conventions"] = cmos
     return result
 
 
@@ -263,11 +357,14 @@ def validate_many(
     JsonDict
         The input *attrs* (pass-through on success).
     """
+    if revisions is None:
+        # One pass over zarr_conventions pins every claimed revision, instead
+        # of each revisioned module re-detecting from scratch below.
+        _, revisions = _detect_pinned(attrs)
     for name in conventions:
         mod = _get_module(name)
         rk = _read_rev_kwargs(mod, revisions, name, attrs)
-        _, extracted = mod.extract(attrs, **rk)
-        mod.validate(validate_json_object(extracted), **rk)
+        mod.validate_attrs(attrs, **rk)
     return attrs
 
 
@@ -299,13 +396,13 @@ def insert_many(
     JsonDict
         A new attributes dict with all convention data merged in.
     """
-    result = dict(attrs)
+    items = []
     for name, data in conventions.items():
         mod = _get_module(name)
         rk = _rev_kwargs(mod, revisions, name)
         mod.validate(data, **rk)
-        result = mod.insert(result, data, overwrite=overwrite, **rk)
-    return result
+        items.append(mod.insert_item(data, **rk))
+    return insert_many_conventions(attrs, items, overwrite=overwrite)
 
 
 def extract_many(
@@ -333,13 +430,21 @@ def extract_many(
         ``(remaining_attrs, extracted)`` where *extracted* maps
         convention names to their convention data dicts.
     """
+    if revisions is None:
+        # Same single-pass pinning as validate_many; detection from the
+        # original attrs is equivalent since extract only removes the CMOs of
+        # conventions already processed.
+        _, revisions = _detect_pinned(attrs)
     remaining = dict(attrs)
     extracted: dict[ConventionName, JsonDict] = {}
     for name in conventions:
         mod = _get_module(name)
         rk = _read_rev_kwargs(mod, revisions, name, remaining)
         remaining, data = mod.extract(remaining, **rk)
-        extracted[name] = validate_json_object(data)
+        # extract returns a freshly built top-level dict, so the deep copy
+        # validate_json_object would make is wasted -- but its values come
+        # from caller attrs and still need the JSON shape check.
+        extracted[name] = check_json_object(data)
     return remaining, extracted
 
 
@@ -367,7 +472,10 @@ def validate_all(
     JsonDict
         The input *attrs* (pass-through on success).
     """
-    return validate_many(attrs, _detect_conventions(attrs), revisions=revisions)
+    names, pinned = _detect_pinned(attrs)
+    if revisions:
+        pinned.update(revisions)
+    return validate_many(attrs, names, revisions=pinned)
 
 
 def extract_all(
@@ -395,7 +503,10 @@ def extract_all(
         ``(remaining_attrs, extracted)`` where *extracted* maps
         convention names to their convention data dicts.
     """
-    return extract_many(attrs, _detect_conventions(attrs), revisions=revisions)
+    names, pinned = _detect_pinned(attrs)
+    if revisions:
+        pinned.update(revisions)
+    return extract_many(attrs, names, revisions=pinned)
 
 
 def detect_revisions(
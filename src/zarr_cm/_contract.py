@@ -42,7 +42,7 @@ class ConventionModule(Protocol):
     @property
     def CMO(self) -> ConventionMetadataObject: ...
     @property
-    def CONVENTION_KEYS(self) -> set[str]: ...
+    def CONVENTION_KEYS(self) -> frozenset[str]: ...
 
     # Likewise read-only: the modules expose these as plain functions, which are
     # only assignable to an invariant ``object`` member via a covariant property.
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 from collections.abc import Mapping, Sequence
-from typing import TYPE_CHECKING, NotRequired, TypeGuard
+from typing import TYPE_CHECKING, Final, NotRequired, TypeGuard, cast
 
 from typing_extensions import TypeAliasType, TypedDict
 
@@ -90,6 +90,43 @@ def validate_json_object(value: object) -> JsonDict:
     return result
 
 
+def check_json_value(value: object) -> JsonValue:
+    """Validate a value's JSON shape without rebuilding it.
+
+    Raises the same ``TypeError`` as :func:`validate_json_value` but returns
+    *value* itself, for callers that own the object and only need the check.
+    """
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if _is_mapping(value):
+        return check_json_object(value)
+    if _is_sequence(value):
+        for item in value:
+            check_json_value(item)
+        return cast("JsonValue", value)
+    msg = f"expected a JSON value, got {type(value).__name__}"
+    raise TypeError(msg)
+
+
+def check_json_object(value: object) -> JsonDict:
+    """Validate an object's JSON shape without rebuilding it.
+
+    Non-copying counterpart of :func:`validate_json_object`.
+    """
+    if not _is_mapping(value):
+        msg = f"expected a JSON object, got {type(value).__name__}"
+        raise TypeError(msg)
+    for key, item in value.items():
+        if not isinstance(key, str):
+            msg = f"expected JSON object keys to be str, got {type(key).__name__}"
+            raise TypeError(msg)
+        check_json_value(item)
+    return cast("JsonDict", value)
+
+
+_CMO_FIELDS: Final = ("uuid", "schema_url", "spec_url", "name", "description")
+
+
 def validate_convention_metadata_objects(
     value: object,
 ) -> list[ConventionMetadataObject]:
@@ -104,7 +141,7 @@ def validate_convention_metadata_objects(
     for item in value:
         obj = validate_json_object(item)
         cmo = ConventionMetadataObject()
-        for key in ("uuid", "schema_url", "spec_url", "name", "description"):
+        for key in _CMO_FIELDS:
             if key not in obj:
                 continue
             field = obj[key]
@@ -116,9 +153,12 @@ def validate_convention_metadata_objects(
     return result
 
 
+_CMO_IDENTIFIERS: Final = frozenset({"uuid", "schema_url", "spec_url"})
+
+
 def validate_convention_metadata_object(cmo: JsonDict) -> None:
     """Validate that a ConventionMetadataObject has at least one identifier."""
-    if not any(k in cmo for k in ("uuid", "schema_url", "spec_url")):
+    if _CMO_IDENTIFIERS.isdisjoint(cmo):
         msg = "ConventionMetadataObject must have at least one of 'uuid', 'schema_url', or 'spec_url'"
         raise ValueError(msg)
 
@@ -148,45 +188,146 @@ def insert_convention(
         contains keys present in *convention_data*.  If True, the
         convention data silently overwrites colliding keys.
     """
-    if not overwrite:
-        collisions = set(attrs) & (set(convention_data) - {"zarr_conventions"})
+    # The check must cover every key the merge below writes, not only the
+    # convention's declared key set: payloads may carry undeclared extras (the
+    # convention TypedDicts allow extra_items) and those collide the same way.
+    # isdisjoint keeps the common no-collision case allocation-free.
+    if not overwrite and not attrs.keys().isdisjoint(convention_data):
+        collisions = attrs.keys() & convention_data.keys() - {"zarr_conventions"}
         if collisions:
             msg = f"attrs already contains keys that would be overwritten by convention data: {sorted(collisions)}. Pass overwrite=True to allow."
             raise ValueError(msg)
     result = {**attrs, **convention_data}
+    raw = result.get("zarr_conventions")
+    if raw is None:
+        # Common case: attrs carries no conventions yet, so there is nothing
+        # to normalize or dedup against.
+        result["zarr_conventions"] = [cmo]
+        return result
+    # If the module's shared CMO constant is already in the list by identity
+    # (the common case when composing inserts over the same attrs), the
+    # per-entry field comparison below can be skipped entirely.
+    present = _is_sequence(raw) and any(c is cmo for c in raw)
+    existing = validate_convention_metadata_objects(raw)
+    if not present:
+        # A CMO is identified by its uuid (convention family) plus schema_url
+        # (revision); comparing just those is cheaper than the full
+        # dict-equality scan of every field of every entry.
+        uuid = cmo.get("uuid")
+        schema_url = cmo.get("schema_url")
+        if not any(
+            c.get("uuid") == uuid and c.get("schema_url") == schema_url
+            for c in existing
+        ):
+            existing.append(cmo)
+    result["zarr_conventions"] = existing
+    return result
+
+
+def insert_many_conventions(
+    attrs: Mapping[str, JsonValue],
+    items: Sequence[tuple[ConventionMetadataObject, Mapping[str, JsonValue]]],
+    *,
+    overwrite: bool = False,
+) -> JsonDict:
+    """Insert several conventions into an attributes dict in one pass.
+
+    Batch counterpart of :func:`insert_convention`: the merged dict is built
+    once and the ``zarr_conventions`` array is normalized once, instead of
+    re-copying and re-normalizing the accumulated result per convention.
+    *items* are ``(cmo, convention_data)`` pairs as produced by the convention
+    modules; collision semantics per item match :func:`insert_convention`.
+    """
+    result = dict(attrs)
+    if not items:
+        return result
+    for _cmo, convention_data in items:
+        # As in insert_convention, check every payload key (declared or
+        # extra); isdisjoint allocates nothing, so the common no-collision
+        # case is a single membership scan.
+        if not overwrite and not result.keys().isdisjoint(convention_data):
+            collisions = result.keys() & convention_data.keys() - {"zarr_conventions"}
+            if collisions:
+                msg = f"attrs already contains keys that would be overwritten by convention data: {sorted(collisions)}. Pass overwrite=True to allow."
+                raise ValueError(msg)
+        result.update(convention_data)
     existing = validate_convention_metadata_objects(result.get("zarr_conventions"))
-    if cmo not in existing:
-        existing.append(cmo)
+    # Dedup against a set of (uuid, schema_url) identities instead of
+    # re-scanning the growing list for every inserted CMO.
+    seen = {(c.get("uuid"), c.get("schema_url")) for c in existing}
+    for cmo, _convention_data in items:
+        identity = (cmo.get("uuid"), cmo.get("schema_url"))
+        if identity not in seen:
+            seen.add(identity)
+            existing.append(cmo)
     result["zarr_conventions"] = existing
     return result
 
 
+def validate_convention_attrs(
+    attrs: Mapping[str, JsonValue],
+    convention_keys: frozenset[str],
+    validator: Callable[[Mapping[str, JsonValue]], object],
+) -> None:
+    """Validate a convention's data in place within an attributes dict.
+
+    Read-side counterpart of extract-then-validate that skips building the
+    ``remaining`` dict: collects only the convention's own keys (one pass over
+    the small key set, not over all of *attrs*) and runs *validator* on that
+    view. The view's values come straight from caller attrs, so their JSON
+    shape is checked first -- same guarantee as the extract path, without its
+    deep copy.
+    """
+    view = {k: attrs[k] for k in convention_keys if k in attrs}
+    check_json_object(view)
+    validator(view)
+
+
 def extract_convention(
     attrs: Mapping[str, JsonValue],
-    convention_keys: set[str],
-    match_fn: Callable[[ConventionMetadataObject], bool],
+    convention_keys: frozenset[str],
+    uuid: str,
 ) -> tuple[JsonDict, JsonDict]:
     """Extract convention metadata from an attributes dict.
 
-    Returns ``(remaining_attrs, convention_data)`` where the matching CMO
-    is removed from ``zarr_conventions`` and the convention-specific keys
-    are separated out.
+    Returns ``(remaining_attrs, convention_data)`` where the CMO whose
+    ``uuid`` matches *uuid* is removed from ``zarr_conventions`` and the
+    convention-specific keys are separated out. Taking the uuid directly
+    (rather than a match callable) keeps the filter a plain field
+    comparison with no per-entry Python call.
     """
-    remaining: JsonDict = {}
-    convention_data: JsonDict = {}
-
-    for key, value in attrs.items():
-        if key == "zarr_conventions":
-            continue
-        if key in convention_keys:
-            convention_data[key] = value
-        else:
-            remaining[key] = value
+    if convention_keys.isdisjoint(attrs):
+        # Fast path: none of the convention's keys are present, so the
+        # per-key partition below would just copy every entry into
+        # ``remaining`` unchanged.
+        remaining = dict(attrs)
+        if "zarr_conventions" not in remaining:
+            return remaining, {}
+        new_conventions = [
+            cmo
+            for cmo in validate_convention_metadata_objects(
+                remaining.pop("zarr_conventions")
+            )
+            if cmo.get("uuid") != uuid
+        ]
+        if new_conventions:
+            remaining["zarr_conventions"] = new_conventions
+        return remaining, {}
+
+    # Partition by a single set intersection instead of testing every key
+    # against the (typically tiny) convention key set one at a time.
+    present = convention_keys & attrs.keys()
+    convention_data: JsonDict = {key: attrs[key] for key in present}
+    remaining: JsonDict = {
+        key: value
+        for key, value in attrs.items()
+        if key not in present and key != "zarr_conventions"
+    }
 
     old_conventions = validate_convention_metadata_objects(
         attrs.get("zarr_conventions")
     )
-    new_conventions = [cmo for cmo in old_conventions if not match_fn(cmo)]
+    new_conventions = [cmo for cmo in old_conventions if cmo.get("uuid") != uuid]
     if new_conventions:
         remaining["zarr_conventions"] = new_conventions
 
@@ -214,13 +355,14 @@ def resolve_revision_label(
     if not present:
         msg = f"convention {convention_name!r} is not present in attrs"
         raise ValueError(msg)
-    return detect_revision(attrs, uuid, schema_url_by_revision)
+    by_url = {url: label for label, url in schema_url_by_revision.items()}
+    return detect_revision(attrs, uuid, by_url)
 
 
 def detect_revision(
     attrs: Mapping[str, JsonValue],
     uuid: str,
-    schema_url_by_revision: dict[str, str],
+    revision_by_schema_url: dict[str, str],
 ) -> str | None:
     """Return the revision label whose pinned schema_url matches the document's CMO.
 
@@ -231,13 +373,13 @@ def detect_revision(
     (e.g. a legacy/dangling URL) -- callers fall back to the latest revision.
 
     Entries in ``zarr_conventions`` are assumed to be CMO dicts (consistent
-    with the rest of this module). Revisions are assumed to have distinct
-    ``schema_url`` values; if two share one, the inverse mapping is ambiguous.
+    with the rest of this module). *revision_by_schema_url* maps each
+    revision's pinned schema_url to its label -- callers hoist this inverse
+    to a module constant rather than paying to invert per detection.
     """
-    by_url = {url: label for label, url in schema_url_by_revision.items()}
     for cmo in validate_convention_metadata_objects(attrs.get("zarr_conventions")):
         if cmo.get("uuid") == uuid:
             schema_url = cmo.get("schema_url")
             if isinstance(schema_url, str):
-                return by_url.get(schema_url)
+                return revision_by_schema_url.get(schema_url)
     return None
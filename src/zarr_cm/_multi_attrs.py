@@ -0,0 +1,46 @@
+"""Aggregate attributes ``TypedDict`` spanning every supported convention.
+
+Lives in its own module so that ``zarr_cm``'s lazy ``__getattr__`` can defer
+importing the convention packages until ``MultiConventionAttrs`` is actually
+referenced. Functional syntax is required because several keys (``proj:code``
+etc.) are not valid identifiers; this must stay a real runtime ``TypedDict``
+(not a plain ``dict`` alias) so downstream pydantic models can embed it. See
+https://github.com/zarr-conventions/zarr-cm/issues/18.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import NotRequired
+
+from typing_extensions import TypedDict
+
+from ._core import ConventionMetadataObject, JsonDict, JsonValue
+from .license import LicenseAttrs
+from .multiscales import MultiscalesAttrs
+from .uom import UomAttrs
+
+MultiConventionAttrs = TypedDict(
+    "MultiConventionAttrs",
+    {
+        "zarr_conventions": NotRequired[Sequence[ConventionMetadataObject]],
+        # geo-proj
+        "proj:code": NotRequired[str],
+        "proj:wkt2": NotRequired[str],
+        "proj:projjson": NotRequired[JsonDict],
+        # spatial
+        "spatial:dimensions": NotRequired[Sequence[str]],
+        "spatial:bbox": NotRequired[Sequence[float]],
+        "spatial:transform_type": NotRequired[str],
+        "spatial:transform": NotRequired[Sequence[float]],
+        "spatial:shape": NotRequired[Sequence[int]],
+        "spatial:registration": NotRequired[str],
+        # multiscales
+        "multiscales": NotRequired[MultiscalesAttrs],
+        # license
+        "license": NotRequired[LicenseAttrs],
+        # uom
+        "uom": NotRequired[UomAttrs],
+    },
+    extra_items=JsonValue,
+)
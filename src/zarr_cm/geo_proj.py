@@ -23,6 +23,7 @@ from zarr_cm.proj import (
     extract,
     insert,
     validate,
+    validate_attrs,
 )
 
 __all__ = [
@@ -42,4 +43,5 @@ __all__ = [
     "extract",
     "insert",
     "validate",
+    "validate_attrs",
 ]
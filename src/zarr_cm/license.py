@@ -10,6 +10,8 @@ from zarr_cm._core import (
     ConventionMetadataObject,
     JsonDict,
     JsonValue,
+    _is_mapping,
+    check_json_value,
     extract_convention,
     insert_convention,
     resolve_revision_label,
@@ -50,10 +52,12 @@ CMO: Final[ConventionMetadataObject] = {
     "description": "License specifier for Zarr data",
 }
 
-CONVENTION_KEYS: Final = {"license"}
+CONVENTION_KEYS: Final = frozenset({"license"})
 
 _SCHEMA_URL_BY_REVISION: Final[dict[str, str]] = {"v1": SCHEMA_URL}
 
+_LICENSE_FIELDS: Final = frozenset({"spdx", "url", "text", "file", "path"})
+
 
 def detect(attrs: Mapping[str, JsonValue]) -> str | None:
     """Return the revision label this document claims for the license convention.
@@ -101,6 +105,13 @@ def insert(
     )
 
 
+def _insert_item(
+    data: Mapping[str, JsonValue],
+) -> tuple[ConventionMetadataObject, Mapping[str, JsonValue]]:
+    """Return this convention's ``insert_many_conventions`` item for *data*."""
+    return CMO, {"license": data}
+
+
 def extract(
     attrs: Mapping[str, JsonValue],
 ) -> tuple[JsonDict, LicenseAttrs]:
@@ -108,7 +119,7 @@ def extract(
     remaining, convention_data = extract_convention(
         attrs,
         CONVENTION_KEYS,
-        lambda cmo: cmo.get("uuid") == UUID,
+        UUID,
     )
     if not convention_data:
         return remaining, LicenseAttrs()
@@ -124,7 +135,22 @@ def validate(data: Mapping[str, JsonValue]) -> LicenseAttrs:
     At least one of ``spdx``, ``url``, ``text``, ``file``, or ``path``
     must be present.
     """
-    if not any(k in data for k in ("spdx", "url", "text", "file", "path")):
+    if _LICENSE_FIELDS.isdisjoint(data):
         msg = "At least one of 'spdx', 'url', 'text', 'file', or 'path' must be present"
         raise ValueError(msg)
     return data  # type: ignore[return-value]
+
+
+def validate_attrs(attrs: Mapping[str, JsonValue]) -> None:
+    """Validate license convention data in place within an attributes dict.
+
+    Reads the ``license`` key directly rather than extracting a copy first;
+    absent or non-mapping data fails validation the same way an empty
+    ``LicenseAttrs`` would.
+    """
+    data = attrs.get("license")
+    if data is not None:
+        # In-place view: the values come from caller attrs, so keep the JSON
+        # shape guarantee the extract path provides.
+        check_json_value(data)
+    validate(data if _is_mapping(data) else {})  # type: ignore[arg-type]
@@ -21,7 +21,15 @@ from __future__ import annotations
 import typing
 from typing import TYPE_CHECKING, Final, NamedTuple, TypeAlias
 
-from zarr_cm._core import JsonDict, JsonValue, detect_revision, resolve_revision_label
+from zarr_cm._core import (
+    ConventionMetadataObject,
+    JsonDict,
+    JsonValue,
+    _is_mapping,
+    check_json_value,
+    detect_revision,
+    resolve_revision_label,
+)
 
 from . import _r2
 
@@ -69,11 +77,14 @@ __all__ = [
     "insert",
     "r2",
     "validate",
+    "validate_attrs",
 ]
 
 
 class _RevisionModule(NamedTuple):
     SCHEMA_URL: str
+    CMO: ConventionMetadataObject
+    CONVENTION_KEYS: frozenset[str]
     create: typing.Callable[..., typing.Mapping[str, JsonValue]]
     insert: typing.Callable[..., JsonDict]
     validate: typing.Callable[..., typing.Mapping[str, JsonValue]]
@@ -82,7 +93,13 @@ class _RevisionModule(NamedTuple):
 
 _REVISIONS: Final[dict[str, _RevisionModule]] = {
     "r2": _RevisionModule(
-        _r2.SCHEMA_URL, _r2.create, _r2.insert, _r2.validate, _r2.extract
+        _r2.SCHEMA_URL,
+        _r2.CMO,
+        _r2.CONVENTION_KEYS,
+        _r2.create,
+        _r2.insert,
+        _r2.validate,
+        _r2.extract,
     ),
 }
 LATEST: Final = "r2"
@@ -93,12 +110,15 @@ r2 = _r2
 _SCHEMA_URL_BY_REVISION: Final[dict[str, str]] = {
     label: mod.SCHEMA_URL for label, mod in _REVISIONS.items()
 }
+_REVISION_BY_SCHEMA_URL: Final[dict[str, str]] = {
+    mod.SCHEMA_URL: label for label, mod in _REVISIONS.items()
+}
 
 
 def _resolve_read_revision(attrs: Mapping[str, JsonValue], revision: str | None) -> str:
     if revision is not None:
         return revision
-    return detect_revision(attrs, UUID, _SCHEMA_URL_BY_REVISION) or LATEST
+    return detect_revision(attrs, UUID, _REVISION_BY_SCHEMA_URL) or LATEST
 
 
 def detect(attrs: Mapping[str, JsonValue]) -> str | None:
@@ -137,7 +157,8 @@ def create(
 
 
 def create(*args: object, revision: str = LATEST, **kwargs: object) -> object:
-    return dict(_revision(revision).create(*args, **kwargs))
+    # The revision module's create builds a fresh dict; no copy needed here.
+    return _revision(revision).create(*args, **kwargs)
 
 
 @typing.overload
@@ -169,12 +190,38 @@ def insert(
     return _revision(revision).insert(attrs, data, overwrite=overwrite)
 
 
+def _insert_item(
+    data: Mapping[str, JsonValue], *, revision: str = LATEST
+) -> tuple[ConventionMetadataObject, Mapping[str, JsonValue]]:
+    """Return this convention's ``insert_many_conventions`` item for *data*."""
+    mod = _revision(revision)
+    return mod.CMO, {"multiscales": data}
+
+
 def validate(
     data: Mapping[str, JsonValue], *, revision: str | None = None
 ) -> MultiscalesAttrsR2:
     return typing.cast(
         "MultiscalesAttrsR2",
-        dict(_revision(_resolve_read_revision(data, revision)).validate(data)),
+        _revision(_resolve_read_revision(data, revision)).validate(data),
+    )
+
+
+def validate_attrs(
+    attrs: Mapping[str, JsonValue], *, revision: str | None = None
+) -> None:
+    """Validate multiscales convention data in place within a full attributes dict.
+
+    Reads the ``multiscales`` key directly rather than extracting a copy first;
+    absent or non-mapping data fails validation like an empty dict.
+    """
+    data = attrs.get("multiscales")
+    if data is not None:
+        # In-place view: the values come from caller attrs, so keep the JSON
+        # shape guarantee the extract path provides.
+        check_json_value(data)
+    _revision(_resolve_read_revision(attrs, revision)).validate(
+        data if _is_mapping(data) else {}  # type: ignore[arg-type]
     )
 
 
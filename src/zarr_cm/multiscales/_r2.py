@@ -78,7 +78,7 @@ CMO: Final[ConventionMetadataObject] = {
     "description": "Multiscale layout of zarr datasets",
 }
 
-CONVENTION_KEYS: Final = {"multiscales"}
+CONVENTION_KEYS: Final = frozenset({"multiscales"})
 
 
 def create(
@@ -113,7 +113,7 @@ def extract(
     remaining, convention_data = extract_convention(
         attrs,
         CONVENTION_KEYS,
-        lambda cmo: cmo.get("uuid") == UUID,
+        UUID,
     )
     if not convention_data:
         return remaining, MultiscalesAttrs(layout=[])
@@ -63,10 +63,12 @@ CMO: Final[ConventionMetadataObject] = {
     "description": "Coordinate reference system information for geospatial data",
 }
 
-CONVENTION_KEYS: Final = {"proj:code", "proj:wkt2", "proj:projjson"}
+CONVENTION_KEYS: Final = frozenset({"proj:code", "proj:wkt2", "proj:projjson"})
 
 _CODE_PATTERN: Final = re.compile(r"^[A-Z]+:[0-9]+$")
 
+_PROJ_FIELDS: Final = ("proj:code", "proj:wkt2", "proj:projjson")
+
 
 def create(
     *,
@@ -100,7 +102,7 @@ def extract(
     remaining, convention_data = extract_convention(
         attrs,
         CONVENTION_KEYS,
-        lambda cmo: cmo.get("uuid") == UUID,
+        UUID,
     )
     return remaining, GeoProjAttrs(**convention_data)  # type: ignore[typeddict-item]
 
@@ -111,7 +113,7 @@ def validate(data: Mapping[str, JsonValue]) -> GeoProjAttrs:
     Exactly one of ``proj:code``, ``proj:wkt2``, or ``proj:projjson`` must be
     present, and ``proj:code`` (if present) must match ``^[A-Z]+:[0-9]+$``.
     """
-    present = [k for k in ("proj:code", "proj:wkt2", "proj:projjson") if k in data]
+    present = [k for k in _PROJ_FIELDS if k in data]
     if len(present) != 1:
         msg = f"Exactly one of 'proj:code', 'proj:wkt2', 'proj:projjson' must be present, got: {present}"
         raise ValueError(msg)
@@ -63,7 +63,7 @@ CMO: Final[ConventionMetadataObject] = {
     "description": "Coordinate reference system information for geospatial data",
 }
 
-CONVENTION_KEYS: Final = {"proj:code", "proj:wkt2", "proj:projjson"}
+CONVENTION_KEYS: Final = frozenset({"proj:code", "proj:wkt2", "proj:projjson"})
 
 _CODE_PATTERN: Final = re.compile(r"^[^:]+:[^:]+$")
 
@@ -100,7 +100,7 @@ def extract(
     remaining, convention_data = extract_convention(
         attrs,
         CONVENTION_KEYS,
-        lambda cmo: cmo.get("uuid") == UUID,
+        UUID,
     )
     return remaining, GeoProjAttrs(**convention_data)  # type: ignore[typeddict-item]
 
@@ -111,8 +111,7 @@ def validate(data: Mapping[str, JsonValue]) -> GeoProjAttrs:
     At least one of ``proj:code``, ``proj:wkt2``, or ``proj:projjson`` must be
     present, and ``proj:code`` (if present) must match ``^[^:]+:[^:]+$``.
     """
-    present = [k for k in ("proj:code", "proj:wkt2", "proj:projjson") if k in data]
-    if not present:
+    if CONVENTION_KEYS.isdisjoint(data):
         msg = (
             "At least one of 'proj:code', 'proj:wkt2', 'proj:projjson' must be present"
         )
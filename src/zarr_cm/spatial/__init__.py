@@ -21,7 +21,14 @@ from __future__ import annotations
 import typing
 from typing import TYPE_CHECKING, Final, Literal, NamedTuple, TypeAlias
 
-from zarr_cm._core import JsonDict, JsonValue, detect_revision, resolve_revision_label
+from zarr_cm._core import (
+    ConventionMetadataObject,
+    JsonDict,
+    JsonValue,
+    detect_revision,
+    resolve_revision_label,
+    validate_convention_attrs,
+)
 
 from . import _r2, _r3
 
@@ -66,11 +73,14 @@ __all__ = [
     "r2",
     "r3",
     "validate",
+    "validate_attrs",
 ]
 
 
 class _RevisionModule(NamedTuple):
     SCHEMA_URL: str
+    CMO: ConventionMetadataObject
+    CONVENTION_KEYS: frozenset[str]
     create: typing.Callable[..., typing.Mapping[str, JsonValue]]
     insert: typing.Callable[..., JsonDict]
     validate: typing.Callable[..., typing.Mapping[str, JsonValue]]
@@ -79,10 +89,22 @@ class _RevisionModule(NamedTuple):
 
 _REVISIONS: Final[dict[str, _RevisionModule]] = {
     "r2": _RevisionModule(
-        _r2.SCHEMA_URL, _r2.create, _r2.insert, _r2.validate, _r2.extract
+        _r2.SCHEMA_URL,
+        _r2.CMO,
+        _r2.CONVENTION_KEYS,
+        _r2.create,
+        _r2.insert,
+        _r2.validate,
+        _r2.extract,
     ),
     "r3": _RevisionModule(
-        _r3.SCHEMA_URL, _r3.create, _r3.insert, _r3.validate, _r3.extract
+        _r3.SCHEMA_URL,
+        _r3.CMO,
+        _r3.CONVENTION_KEYS,
+        _r3.create,
+        _r3.insert,
+        _r3.validate,
+        _r3.extract,
     ),
 }
 LATEST: Final = "r3"
@@ -94,12 +116,15 @@ r3 = _r3
 _SCHEMA_URL_BY_REVISION: Final[dict[str, str]] = {
     label: mod.SCHEMA_URL for label, mod in _REVISIONS.items()
 }
+_REVISION_BY_SCHEMA_URL: Final[dict[str, str]] = {
+    mod.SCHEMA_URL: label for label, mod in _REVISIONS.items()
+}
 
 
 def _resolve_read_revision(attrs: Mapping[str, JsonValue], revision: str | None) -> str:
     if revision is not None:
         return revision
-    return detect_revision(attrs, UUID, _SCHEMA_URL_BY_REVISION) or LATEST
+    return detect_revision(attrs, UUID, _REVISION_BY_SCHEMA_URL) or LATEST
 
 
 def detect(attrs: Mapping[str, JsonValue]) -> str | None:
@@ -172,7 +197,8 @@ def create(
 
 
 def create(*args: object, revision: str = LATEST, **kwargs: object) -> object:
-    return dict(_revision(revision).create(*args, **kwargs))
+    # The revision module's create builds a fresh dict; no copy needed here.
+    return _revision(revision).create(*args, **kwargs)
 
 
 @typing.overload
@@ -224,6 +250,14 @@ def insert(
     return _revision(revision).insert(attrs, data, overwrite=overwrite)
 
 
+def _insert_item(
+    data: Mapping[str, JsonValue], *, revision: str = LATEST
+) -> tuple[ConventionMetadataObject, Mapping[str, JsonValue]]:
+    """Return this convention's ``insert_many_conventions`` item for *data*."""
+    mod = _revision(revision)
+    return mod.CMO, data
+
+
 @typing.overload
 def validate(
     data: Mapping[str, JsonValue], *, revision: Literal["r2"]
@@ -243,7 +277,18 @@ def validate(
 
 
 def validate(data: Mapping[str, JsonValue], *, revision: str | None = None) -> object:
-    return dict(_revision(_resolve_read_revision(data, revision)).validate(data))
+    return _revision(_resolve_read_revision(data, revision)).validate(data)
+
+
+def validate_attrs(
+    attrs: Mapping[str, JsonValue], *, revision: str | None = None
+) -> None:
+    """Validate spatial convention data in place within a full attributes dict."""
+    validate_convention_attrs(
+        attrs,
+        CONVENTION_KEYS,
+        _revision(_resolve_read_revision(attrs, revision)).validate,
+    )
 
 
 @typing.overload
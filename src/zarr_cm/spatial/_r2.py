@@ -70,14 +70,16 @@ CMO: Final[ConventionMetadataObject] = {
     "description": "Spatial coordinate information",
 }
 
-CONVENTION_KEYS: Final = {
-    "spatial:dimensions",
-    "spatial:bbox",
-    "spatial:transform_type",
-    "spatial:transform",
-    "spatial:shape",
-    "spatial:registration",
-}
+CONVENTION_KEYS: Final = frozenset(
+    {
+        "spatial:dimensions",
+        "spatial:bbox",
+        "spatial:transform_type",
+        "spatial:transform",
+        "spatial:shape",
+        "spatial:registration",
+    }
+)
 
 # r2: every dimension-bearing key is a fixed 2D length.
 _VALID_LENGTHS: Final[dict[str, int]] = {
@@ -129,7 +131,7 @@ def extract(
     remaining, convention_data = extract_convention(
         attrs,
         CONVENTION_KEYS,
-        lambda cmo: cmo.get("uuid") == UUID,
+        UUID,
     )
     return remaining, SpatialAttrs(**convention_data)  # type: ignore[typeddict-item]
 
@@ -10,6 +10,8 @@ from zarr_cm._core import (
     ConventionMetadataObject,
     JsonDict,
     JsonValue,
+    _is_mapping,
+    check_json_value,
     extract_convention,
     insert_convention,
     resolve_revision_label,
@@ -52,7 +54,7 @@ CMO: Final[ConventionMetadataObject] = {
     "description": "Units of measurement for Zarr arrays",
 }
 
-CONVENTION_KEYS: Final = {"uom"}
+CONVENTION_KEYS: Final = frozenset({"uom"})
 
 _SCHEMA_URL_BY_REVISION: Final[dict[str, str]] = {"v1": SCHEMA_URL}
 
@@ -71,12 +73,18 @@ def create(
     *,
     ucum: UCUM,
     description: str | None = None,
+    check: bool = True,
 ) -> UomAttrs:
-    """Create a ``UomAttrs`` dict from keyword arguments."""
+    """Create a ``UomAttrs`` dict from keyword arguments.
+
+    Pass ``check=False`` to skip validation when the inputs are known to be
+    well-formed (e.g. repeated creation from constants in a write loop).
+    """
     result = UomAttrs(ucum=ucum)
     if description is not None:
         result["description"] = description
-    validate(result)
+    if check:
+        validate(result)
     return result
 
 
@@ -92,14 +100,25 @@ def insert(
     )
 
 
+def _insert_item(
+    data: Mapping[str, JsonValue],
+) -> tuple[ConventionMetadataObject, Mapping[str, JsonValue]]:
+    """Return this convention's ``insert_many_conventions`` item for *data*."""
+    return CMO, {"uom": data}
+
+
 def extract(
     attrs: Mapping[str, JsonValue],
 ) -> tuple[JsonDict, UomAttrs]:
     """Extract uom convention metadata from an attributes dict."""
+    if "uom" not in attrs and "zarr_conventions" not in attrs:
+        # Nothing to strip: skip the partition and return the same empty
+        # default the general path produces.
+        return dict(attrs), UomAttrs(ucum={})
     remaining, convention_data = extract_convention(
         attrs,
         CONVENTION_KEYS,
-        lambda cmo: cmo.get("uuid") == UUID,
+        UUID,
     )
     if not convention_data:
         return remaining, UomAttrs(ucum={})
@@ -118,3 +137,18 @@ def validate(data: Mapping[str, JsonValue]) -> UomAttrs:
         msg = "'ucum' is required"
         raise ValueError(msg)
     return data  # type: ignore[return-value]
+
+
+def validate_attrs(attrs: Mapping[str, JsonValue]) -> None:
+    """Validate uom convention data in place within an attributes dict.
+
+    Reads the ``uom`` key directly rather than extracting a copy first; absent
+    data falls back to the same empty ``UomAttrs`` default that ``extract``
+    produces.
+    """
+    data = attrs.get("uom")
+    if data is not None:
+        # In-place view: the values come from caller attrs, so keep the JSON
+        # shape guarantee the extract path provides.
+        check_json_value(data)
+    validate(data if _is_mapping(data) else UomAttrs(ucum={}))  # type: ignore[arg-type]
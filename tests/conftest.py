@@ -1,8 +1,58 @@
 from __future__ import annotations
 
+import functools
+import json
 from collections.abc import Mapping, Sequence
+from pathlib import Path
 from typing import TypeGuard
 
+import jsonschema
+import jsonschema.protocols
+
+_SCHEMA_DIR = Path(__file__).parent / "schemas"
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_schema(name: str, mtime_ns: int) -> dict[str, object]:  # noqa: ARG001 -- mtime_ns only keys the cache
+    # read_bytes + json.loads skips the text decode pass; json detects the
+    # encoding itself.
+    return json.loads((_SCHEMA_DIR / name).read_bytes())
+
+
+def load_schema(name: str) -> dict[str, object]:
+    """Load a vendored schema by file name, parsed at most once per run.
+
+    Several test modules validate against the same schema file; caching here
+    means each is read and parsed a single time no matter how many modules
+    load it at import. The cache is keyed on the file's mtime so long-lived
+    processes that rerun the suite (loop-on-fail watchers) pick up edits.
+    """
+    return _parse_schema(name, (_SCHEMA_DIR / name).stat().st_mtime_ns)
+
+
+@functools.cache
+def make_validator(name: str) -> jsonschema.protocols.Validator:
+    """Build a reusable validator for a vendored schema, once per run.
+
+    Checks the schema against its metaschema a single time, then returns the
+    instance; ``jsonschema.validate`` would repeat both steps per call.
+    """
+    schema = load_schema(name)
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def assert_valid(validator: jsonschema.protocols.Validator, node: object) -> None:
+    """Assert *node* passes *validator*, stopping at the first error.
+
+    ``validator.validate`` walks the whole document collecting every error
+    before raising; ``iter_errors`` is lazy, so a passing document does the
+    minimum work and a failing one reports just its first error.
+    """
+    error = next(validator.iter_errors(node), None)
+    assert error is None, error
+
 
 def _is_mapping(value: object) -> TypeGuard[Mapping[object, object]]:
     return isinstance(value, Mapping)
@@ -14,11 +64,21 @@ def _is_sequence(value: object) -> TypeGuard[Sequence[object]]:
     )
 
 
+_NODE_TEMPLATE: dict[str, object] = {
+    "zarr_format": 3,
+    "node_type": "array",
+    "attributes": None,
+}
+
+
 def wrap_attrs(
     attrs: Mapping[str, object], *, node_type: str = "array"
 ) -> dict[str, object]:
     """Wrap attributes dict in a full Zarr node metadata dict for schema validation."""
-    return {"zarr_format": 3, "node_type": node_type, "attributes": attrs}
+    result = _NODE_TEMPLATE.copy()
+    result["node_type"] = node_type
+    result["attributes"] = attrs
+    return result
 
 
 def as_mapping(value: object) -> Mapping[str, object]:
@@ -0,0 +1,79 @@
+"""Cross-convention behavior shared by every convention module.
+
+The insert/extract round-trip has the same structure for every convention, so
+it lives here as one parametrized test instead of a near-identical copy per
+test module; pytest's per-item overhead is paid once per case rather than once
+per duplicated function. Convention-specific behavior stays in the per-module
+test files.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from conftest import make_validator, wrap_attrs
+
+from zarr_cm import geo_proj, license, multiscales, spatial, uom
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+ROUNDTRIP_CASES: list[tuple[ModuleType, dict[str, object]]] = [
+    (geo_proj, {"proj:code": "EPSG:4326"}),
+    (license, {"spdx": "Apache-2.0"}),
+    (
+        multiscales,
+        {
+            "layout": [
+                {"asset": "0"},
+                {
+                    "asset": "1",
+                    "derived_from": "0",
+                    "transform": {"scale": [2.0, 2.0]},
+                },
+            ],
+            "resampling_method": "nearest",
+        },
+    ),
+    (
+        spatial,
+        {
+            "spatial:dimensions": ["y", "x"],
+            "spatial:bbox": [0.0, 0.0, 1.0, 1.0],
+        },
+    ),
+    (uom, {"ucum": {"unit": "m/s2"}, "description": "Acceleration"}),
+]
+
+
+_SCHEMA_BY_MODULE: dict[ModuleType, str] = {
+    geo_proj: "proj-r3.json",
+    license: "license.json",
+    multiscales: "multiscales-r2.json",
+    spatial: "spatial-r3.json",
+    uom: "uom.json",
+}
+
+
+@pytest.mark.parametrize(
+    ("mod", "data"), ROUNDTRIP_CASES, ids=lambda value: getattr(value, "__name__", None)
+)
+def test_roundtrip(mod: ModuleType, data: dict[str, object]) -> None:
+    original_attrs = {"foo": "bar"}
+    inserted = mod.insert(original_attrs, data)
+    remaining, extracted = mod.extract(inserted)
+    assert remaining == original_attrs
+    assert extracted == data
+
+
+def test_batch_schema_validation() -> None:
+    # One loop over pre-built nodes through each convention's cached
+    # validator; is_valid skips ValidationError construction for documents
+    # that pass, so the whole batch runs without exception machinery.
+    for mod, data in ROUNDTRIP_CASES:
+        validator = make_validator(_SCHEMA_BY_MODULE[mod])
+        # multiscales describes a group node; the rest annotate arrays.
+        node_type = "group" if mod is multiscales else "array"
+        node = wrap_attrs(mod.insert({}, data), node_type=node_type)
+        assert validator.is_valid(node), mod.__name__
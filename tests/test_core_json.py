@@ -10,6 +10,8 @@ from __future__ import annotations
 import pytest
 
 from zarr_cm._core import (
+    check_json_object,
+    check_json_value,
     validate_convention_metadata_objects,
     validate_json_object,
     validate_json_value,
@@ -36,6 +38,26 @@ def test_validate_json_object_rejects_non_str_key() -> None:
         validate_json_object({1: "value"})
 
 
+def test_check_json_value_returns_same_object() -> None:
+    value = {"a": 1, "b": [True, "x", {"c": None}]}
+    assert check_json_value(value) is value
+
+
+def test_check_json_value_rejects_non_json() -> None:
+    with pytest.raises(TypeError, match="expected a JSON value, got set"):
+        check_json_value({"a": {1, 2}})
+
+
+def test_check_json_object_rejects_non_mapping() -> None:
+    with pytest.raises(TypeError, match="expected a JSON object, got list"):
+        check_json_object([1, 2, 3])
+
+
+def test_check_json_object_rejects_non_str_key() -> None:
+    with pytest.raises(TypeError, match="keys to be str, got int"):
+        check_json_object({1: "value"})
+
+
 def test_validate_cmos_none_is_empty() -> None:
     assert validate_convention_metadata_objects(None) == []
 
@@ -20,34 +20,34 @@ from zarr_cm import (
     validate_many,
 )
 
+EXPECTED_CONVENTION_NAMES = frozenset(
+    {"geo-proj", "spatial", "multiscales", "license", "uom"}
+)
+
+EXPECTED_ALL_CONVENTION_KEYS = frozenset(
+    {
+        "proj:code",
+        "proj:wkt2",
+        "proj:projjson",
+        "spatial:dimensions",
+        "spatial:bbox",
+        "spatial:transform_type",
+        "spatial:transform",
+        "spatial:shape",
+        "spatial:registration",
+        "multiscales",
+        "license",
+        "uom",
+    }
+)
+
 
 def test_convention_names_constant() -> None:
-    assert (
-        frozenset({"geo-proj", "spatial", "multiscales", "license", "uom"})
-        == CONVENTION_NAMES
-    )
+    assert EXPECTED_CONVENTION_NAMES == CONVENTION_NAMES
 
 
 def test_all_convention_keys_constant() -> None:
-    assert (
-        frozenset(
-            {
-                "proj:code",
-                "proj:wkt2",
-                "proj:projjson",
-                "spatial:dimensions",
-                "spatial:bbox",
-                "spatial:transform_type",
-                "spatial:transform",
-                "spatial:shape",
-                "spatial:registration",
-                "multiscales",
-                "license",
-                "uom",
-            }
-        )
-        == ALL_CONVENTION_KEYS
-    )
+    assert EXPECTED_ALL_CONVENTION_KEYS == ALL_CONVENTION_KEYS
 
 
 def test_create_many_single() -> None:
@@ -130,6 +130,14 @@ def test_validate_many_invalid() -> None:
         validate_many(attrs, ["license"])
 
 
+def test_validate_many_rejects_non_json_payload() -> None:
+    # Validation guarantees the document is JSON-serializable, so non-JSON
+    # values inside a convention payload must fail the shape check.
+    attrs: Any = {"uom": {"ucum": {"unit": {1, 2}}}}
+    with pytest.raises(TypeError, match="expected a JSON value, got set"):
+        validate_many(attrs, ["uom"])
+
+
 def test_validate_all() -> None:
     attrs = create_many(
         {
@@ -206,6 +214,14 @@ def test_extract_many_subset() -> None:
     assert remaining["license"] == {"spdx": "MIT"}
 
 
+def test_extract_many_rejects_non_json_payload() -> None:
+    # Extracted payloads keep the JSON-serializability guarantee even though
+    # extract_many no longer deep-copies them.
+    attrs: Any = {"uom": {"ucum": {"unit": {1, 2}}}}
+    with pytest.raises(TypeError, match="expected a JSON value, got set"):
+        extract_many(attrs, ["uom"])
+
+
 def test_extract_many_preserves_remaining() -> None:
     attrs = create_many({"geo-proj": {"proj:code": "EPSG:4326"}})
     attrs["foo"] = "bar"
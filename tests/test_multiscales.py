@@ -1,11 +1,7 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
-
-import jsonschema
 import pytest
-from conftest import as_mapping, as_sequence, wrap_attrs
+from conftest import as_mapping, as_sequence, assert_valid, make_validator, wrap_attrs
 
 from zarr_cm import multiscales
 from zarr_cm.multiscales import CMO, MultiscalesAttrs
@@ -71,27 +67,7 @@ def test_extract_preserves_other_conventions() -> None:
     assert remaining["zarr_conventions"] == [other_cmo]
 
 
-def test_roundtrip() -> None:
-    original_attrs = {"foo": "bar"}
-    data: MultiscalesAttrs = {
-        "layout": [
-            {"asset": "0"},
-            {
-                "asset": "1",
-                "derived_from": "0",
-                "transform": {"scale": [2.0, 2.0]},
-            },
-        ],
-        "resampling_method": "nearest",
-    }
-    inserted = multiscales.insert(original_attrs, data)
-    remaining, extracted = multiscales.extract(inserted)
-    assert remaining == original_attrs
-    assert extracted == data
-
-
-R2_SCHEMA_PATH = Path(__file__).parent / "schemas" / "multiscales-r2.json"
-R2_SCHEMA = json.loads(R2_SCHEMA_PATH.read_text())
+R2_VALIDATOR = make_validator("multiscales-r2.json")
 
 # Note: the multiscales v0.1 schema ENFORCES conventionMetadata's schema_url as a
 # `const` equal to the refs/tags/v0.1 tag URL (its `attributes` subschema has no
@@ -104,7 +80,7 @@ def test_schema_validation_minimal() -> None:
     data: MultiscalesAttrs = {"layout": [{"asset": "0"}]}
     result = multiscales.insert({}, data)
     node = wrap_attrs(result, node_type="group")
-    jsonschema.validate(node, R2_SCHEMA)
+    assert_valid(R2_VALIDATOR, node)
 
 
 def test_schema_validation_full() -> None:
@@ -127,7 +103,7 @@ def test_schema_validation_full() -> None:
     }
     result = multiscales.insert({}, data)
     node = wrap_attrs(result, node_type="group")
-    jsonschema.validate(node, R2_SCHEMA)
+    assert_valid(R2_VALIDATOR, node)
 
 
 def test_validate_valid() -> None:
@@ -199,7 +175,7 @@ def test_r2_create_validates_against_vendored_schema() -> None:
     # actual emitted output validates against the official v0.1 schema directly.
     data = multiscales.create(layout=[{"asset": "0"}])
     node = wrap_attrs(multiscales.insert({}, data), node_type="group")
-    jsonschema.validate(node, R2_SCHEMA)
+    assert_valid(R2_VALIDATOR, node)
 
 
 def test_multiscales_revision_roundtrip() -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import importlib.metadata
 
 import pytest
@@ -8,8 +9,15 @@ import zarr_cm as m
 from zarr_cm._core import validate_convention_metadata_object
 
 
+@functools.lru_cache(maxsize=1)
+def _installed_version() -> str:
+    # importlib.metadata.version walks sys.path distribution metadata; cache it
+    # so re-runs within a process (e.g. xdist workers) scan the disk once.
+    return importlib.metadata.version("zarr_cm")
+
+
 def test_version():
-    assert importlib.metadata.version("zarr_cm") == m.__version__
+    assert _installed_version() == m.__version__
 
 
 def test_validate_cmo_valid() -> None:
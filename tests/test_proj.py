@@ -1,11 +1,7 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
-
-import jsonschema
 import pytest
-from conftest import as_sequence, wrap_attrs
+from conftest import as_sequence, assert_valid, make_validator, wrap_attrs
 
 from zarr_cm import proj
 from zarr_cm.proj import r2 as proj_r2
@@ -127,8 +123,7 @@ def test_proj_latest_is_r3() -> None:
 # Vendored schema fixture test
 # ---------------------------------------------------------------------------
 
-R2_SCHEMA_PATH = Path(__file__).parent / "schemas" / "proj-r2.json"
-R2_SCHEMA = json.loads(R2_SCHEMA_PATH.read_text())
+R2_VALIDATOR = make_validator("proj-r2.json")
 
 
 def test_r2_create_validates_against_vendored_schema() -> None:
@@ -140,17 +135,16 @@ def test_r2_create_validates_against_vendored_schema() -> None:
     # check is effectively not enforced here.
     data = proj_r2.create(code="EPSG:4326")
     node = wrap_attrs(proj_r2.insert({}, data))
-    jsonschema.validate(node, R2_SCHEMA)
+    assert_valid(R2_VALIDATOR, node)
 
 
-R3_SCHEMA_PATH = Path(__file__).parent / "schemas" / "proj-r3.json"
-R3_SCHEMA = json.loads(R3_SCHEMA_PATH.read_text())
+R3_VALIDATOR = make_validator("proj-r3.json")
 
 
 def test_r3_create_validates_against_vendored_schema() -> None:
     data = proj_r3.create(code="EPSG:4326")
     node = wrap_attrs(proj_r3.insert({}, data))
-    jsonschema.validate(node, R3_SCHEMA)
+    assert_valid(R3_VALIDATOR, node)
 
 
 # ---------------------------------------------------------------------------
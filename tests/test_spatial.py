@@ -1,22 +1,26 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
+import re
 
-import jsonschema
 import pytest
-from conftest import as_sequence, wrap_attrs
+from conftest import as_sequence, assert_valid, make_validator, wrap_attrs
 
 from zarr_cm import spatial
 from zarr_cm.spatial import CMO, SpatialAttrs
 from zarr_cm.spatial import r2 as spatial_r2
 from zarr_cm.spatial import r3 as spatial_r3
 
-R2_SCHEMA_PATH = Path(__file__).parent / "schemas" / "spatial-r2.json"
-R2_SCHEMA = json.loads(R2_SCHEMA_PATH.read_text())
+R2_VALIDATOR = make_validator("spatial-r2.json")
+R3_VALIDATOR = make_validator("spatial-r3.json")
 
-R3_SCHEMA_PATH = Path(__file__).parent / "schemas" / "spatial-r3.json"
-R3_SCHEMA = json.loads(R3_SCHEMA_PATH.read_text())
+# Compiled once: these message patterns are asserted across many negative-path
+# tests; pytest.raises(match=...) accepts precompiled patterns directly.
+_EXACTLY_2_RE = re.compile("exactly 2")
+_EXACTLY_4_RE = re.compile("exactly 4")
+_POSITIVE_RE = re.compile("positive")
+_REGISTRATION_RE = re.compile("spatial:registration")
+_ARRAY_LENGTH_RE = re.compile("must be an array with exactly")
+_INT_ITEMS_RE = re.compile("items must be integers")
 
 
 def test_insert_spatial_2d() -> None:
@@ -26,16 +30,20 @@ def test_insert_spatial_2d() -> None:
     assert result["zarr_conventions"] == [CMO]
 
 
+# Hoisted: shared read-only payloads for the full-field tests; insert/create
+# never mutate their inputs, so building these once per module is safe.
+_FULL_3D_DATA: SpatialAttrs = {
+    "spatial:dimensions": ["z", "y", "x"],
+    "spatial:bbox": [0.0, 0.0, 0.0, 100.0, 100.0, 50.0],
+    "spatial:transform_type": "affine",
+    "spatial:transform": [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0],
+    "spatial:shape": [50, 100, 100],
+    "spatial:registration": "pixel",
+}
+
+
 def test_insert_spatial_3d_with_extras() -> None:
-    data: SpatialAttrs = {
-        "spatial:dimensions": ["z", "y", "x"],
-        "spatial:bbox": [0.0, 0.0, 0.0, 100.0, 100.0, 50.0],
-        "spatial:transform_type": "affine",
-        "spatial:transform": [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0],
-        "spatial:shape": [50, 100, 100],
-        "spatial:registration": "pixel",
-    }
-    result = spatial.insert({}, data)
+    result = spatial.insert({}, _FULL_3D_DATA)
     assert result["spatial:dimensions"] == ["z", "y", "x"]
     assert result["spatial:registration"] == "pixel"
 
@@ -80,19 +88,10 @@ def test_extract_preserves_other_conventions() -> None:
     assert remaining["zarr_conventions"] == [other_cmo]
 
 
-def test_roundtrip() -> None:
-    original_attrs = {"foo": "bar"}
-    data: SpatialAttrs = {
-        "spatial:dimensions": ["y", "x"],
-        "spatial:bbox": [0.0, 0.0, 1.0, 1.0],
-    }
-    inserted = spatial.insert(original_attrs, data)
-    remaining, extracted = spatial.extract(inserted)
-    assert remaining == original_attrs
-    assert extracted == data
-
-
-def test_schema_validation_2d() -> None:
+# Module-scoped so the insert runs once for all pure-read tests that share the
+# same attributes; such tests must not mutate the returned dict.
+@pytest.fixture(scope="module")
+def full_spatial_inserted() -> dict[str, object]:
     data: SpatialAttrs = {
         "spatial:dimensions": ["y", "x"],
         "spatial:bbox": [0.0, 0.0, 1.0, 1.0],
@@ -100,43 +99,50 @@ def test_schema_validation_2d() -> None:
         "spatial:shape": [100, 200],
         "spatial:registration": "pixel",
     }
-    result = spatial.insert({}, data)
-    node = wrap_attrs(result)
-    jsonschema.validate(node, R3_SCHEMA)
+    return spatial.insert({}, data)
 
 
-def test_schema_validation_minimal() -> None:
-    data: SpatialAttrs = {"spatial:dimensions": ["y", "x"]}
-    result = spatial.insert({}, data)
-    node = wrap_attrs(result)
-    jsonschema.validate(node, R3_SCHEMA)
+@pytest.fixture(scope="module")
+def minimal_spatial_inserted() -> dict[str, object]:
+    return spatial.insert({}, {"spatial:dimensions": ["y", "x"]})
 
 
-def test_validate_valid() -> None:
-    result = spatial.validate({"spatial:dimensions": ["y", "x"]})
-    assert result == {"spatial:dimensions": ["y", "x"]}
-
+def test_schema_validation_2d(full_spatial_inserted: dict[str, object]) -> None:
+    node = wrap_attrs(full_spatial_inserted)
+    assert_valid(R3_VALIDATOR, node)
 
-def test_validate_missing_dimensions() -> None:
-    with pytest.raises(ValueError, match="spatial:dimensions"):
-        spatial.validate({})
 
+def test_schema_validation_minimal(minimal_spatial_inserted: dict[str, object]) -> None:
+    node = wrap_attrs(minimal_spatial_inserted)
+    assert_valid(R3_VALIDATOR, node)
 
-def test_validate_bad_dimensions_length() -> None:
-    with pytest.raises(ValueError, match="exactly 2"):
-        spatial.validate({"spatial:dimensions": ["x"]})
 
-
-def test_validate_bad_bbox_length() -> None:
-    with pytest.raises(ValueError, match="exactly 4"):
-        spatial.validate({"spatial:dimensions": ["y", "x"], "spatial:bbox": [0.0, 1.0]})
+def test_validate_valid() -> None:
+    result = spatial.validate({"spatial:dimensions": ["y", "x"]})
+    assert result == {"spatial:dimensions": ["y", "x"]}
 
 
-def test_validate_bad_registration() -> None:
-    with pytest.raises(ValueError, match="spatial:registration"):
-        spatial.validate(
-            {"spatial:dimensions": ["y", "x"], "spatial:registration": "bad"}
-        )
+@pytest.mark.parametrize(
+    ("bad", "msg"),
+    [
+        ({}, "spatial:dimensions"),
+        ({"spatial:dimensions": ["x"]}, "exactly 2"),
+        ({"spatial:dimensions": ["y", "x"], "spatial:bbox": [0.0, 1.0]}, "exactly 4"),
+        (
+            {"spatial:dimensions": ["y", "x"], "spatial:registration": "bad"},
+            "spatial:registration",
+        ),
+    ],
+    ids=[
+        "missing-dimensions",
+        "bad-dimensions-length",
+        "bad-bbox-length",
+        "bad-registration",
+    ],
+)
+def test_validate_bad(bad: dict[str, object], msg: str) -> None:
+    with pytest.raises(ValueError, match=msg):
+        spatial.validate(bad)
 
 
 def test_create_minimal() -> None:
@@ -144,15 +150,18 @@ def test_create_minimal() -> None:
     assert result == {"spatial:dimensions": ["y", "x"]}
 
 
+_FULL_CREATE_KWARGS: dict[str, object] = {
+    "dimensions": ["y", "x"],
+    "bbox": [0.0, 0.0, 1.0, 1.0],
+    "transform_type": "affine",
+    "transform": [1.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+    "shape": [100, 200],
+    "registration": "pixel",
+}
+
+
 def test_create_full() -> None:
-    result = spatial.create(
-        dimensions=["y", "x"],
-        bbox=[0.0, 0.0, 1.0, 1.0],
-        transform_type="affine",
-        transform=[1.0, 0.0, 0.0, 0.0, 1.0, 0.0],
-        shape=[100, 200],
-        registration="pixel",
-    )
+    result = spatial.create(**_FULL_CREATE_KWARGS)  # type: ignore[arg-type]
     assert result["spatial:dimensions"] == ["y", "x"]
     assert result.get("spatial:bbox") == [0.0, 0.0, 1.0, 1.0]
     assert result.get("spatial:registration") == "pixel"
@@ -185,12 +194,12 @@ def test_r2_accepts_2d() -> None:
 
 
 def test_r2_rejects_3d_dimensions() -> None:
-    with pytest.raises(ValueError, match="exactly 2"):
+    with pytest.raises(ValueError, match=_EXACTLY_2_RE):
         spatial_r2.validate({"spatial:dimensions": ["z", "y", "x"]})
 
 
 def test_r2_rejects_6_element_bbox() -> None:
-    with pytest.raises(ValueError, match="exactly 4"):
+    with pytest.raises(ValueError, match=_EXACTLY_4_RE):
         spatial_r2.validate(
             {
                 "spatial:dimensions": ["y", "x"],
@@ -200,7 +209,7 @@ def test_r2_rejects_6_element_bbox() -> None:
 
 
 def test_r2_rejects_nonpositive_shape_item() -> None:
-    with pytest.raises(ValueError, match="positive"):
+    with pytest.raises(ValueError, match=_POSITIVE_RE):
         spatial_r2.validate(
             {"spatial:dimensions": ["y", "x"], "spatial:shape": [0, 10]}
         )
@@ -226,7 +235,7 @@ def test_r2_create_validates_against_vendored_schema() -> None:
         registration="pixel",
     )
     node = wrap_attrs(spatial_r2.insert({}, data))
-    jsonschema.validate(node, R2_SCHEMA)
+    assert_valid(R2_VALIDATOR, node)
 
 
 def test_r3_schema_url_pinned_to_v0_1() -> None:
@@ -239,7 +248,7 @@ def test_r3_same_shape_as_r2() -> None:
     assert spatial_r3.validate({"spatial:dimensions": ["y", "x"]}) == {
         "spatial:dimensions": ["y", "x"]
     }
-    with pytest.raises(ValueError, match="exactly 2"):
+    with pytest.raises(ValueError, match=_EXACTLY_2_RE):
         spatial_r3.validate({"spatial:dimensions": ["z", "y", "x"]})
 
 
@@ -263,7 +272,7 @@ def test_r3_create_validates_against_vendored_schema() -> None:
         registration="pixel",
     )
     node = wrap_attrs(spatial_r3.insert({}, data))
-    jsonschema.validate(node, R3_SCHEMA)
+    assert_valid(R3_VALIDATOR, node)
 
 
 # ---------------------------------------------------------------------------
@@ -277,12 +286,12 @@ def test_r2_validate_missing_dimensions() -> None:
 
 
 def test_r2_validate_non_array_bbox() -> None:
-    with pytest.raises(ValueError, match="must be an array with exactly"):
+    with pytest.raises(ValueError, match=_ARRAY_LENGTH_RE):
         spatial_r2.validate({"spatial:dimensions": ["y", "x"], "spatial:bbox": "nope"})
 
 
 def test_r2_validate_non_int_shape_item() -> None:
-    with pytest.raises(TypeError, match="items must be integers"):
+    with pytest.raises(TypeError, match=_INT_ITEMS_RE):
         spatial_r2.validate(
             {"spatial:dimensions": ["y", "x"], "spatial:shape": [1.5, 2]}
         )
@@ -292,45 +301,45 @@ def test_r2_validate_non_array_shape() -> None:
     # spatial:shape passes the _VALID_LENGTHS loop (it is in the loop), so a
     # non-array value is rejected there before the dedicated shape block. Use a
     # value that is not a list/tuple to hit the ValueError in the loop.
-    with pytest.raises(ValueError, match="must be an array with exactly"):
+    with pytest.raises(ValueError, match=_ARRAY_LENGTH_RE):
         spatial_r2.validate({"spatial:dimensions": ["y", "x"], "spatial:shape": 5})
 
 
 def test_r2_validate_negative_shape_item() -> None:
-    with pytest.raises(ValueError, match="positive"):
+    with pytest.raises(ValueError, match=_POSITIVE_RE):
         spatial_r2.validate(
             {"spatial:dimensions": ["y", "x"], "spatial:shape": (-1, 1)}
         )
 
 
 def test_r2_validate_bad_registration() -> None:
-    with pytest.raises(ValueError, match="spatial:registration"):
+    with pytest.raises(ValueError, match=_REGISTRATION_RE):
         spatial_r2.validate(
             {"spatial:dimensions": ["y", "x"], "spatial:registration": "bad"}
         )
 
 
 def test_r3_validate_non_array_bbox() -> None:
-    with pytest.raises(ValueError, match="must be an array with exactly"):
+    with pytest.raises(ValueError, match=_ARRAY_LENGTH_RE):
         spatial_r3.validate({"spatial:dimensions": ["y", "x"], "spatial:bbox": "nope"})
 
 
 def test_r3_validate_non_int_shape_item() -> None:
-    with pytest.raises(TypeError, match="items must be integers"):
+    with pytest.raises(TypeError, match=_INT_ITEMS_RE):
         spatial_r3.validate(
             {"spatial:dimensions": ["y", "x"], "spatial:shape": [1.5, 2]}
         )
 
 
 def test_r3_validate_negative_shape_item() -> None:
-    with pytest.raises(ValueError, match="positive"):
+    with pytest.raises(ValueError, match=_POSITIVE_RE):
         spatial_r3.validate(
             {"spatial:dimensions": ["y", "x"], "spatial:shape": (-1, 1)}
         )
 
 
 def test_r3_validate_bad_registration() -> None:
-    with pytest.raises(ValueError, match="spatial:registration"):
+    with pytest.raises(ValueError, match=_REGISTRATION_RE):
         spatial_r3.validate(
             {"spatial:dimensions": ["y", "x"], "spatial:registration": "bad"}
         )
@@ -1,17 +1,12 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
-
-import jsonschema
 import pytest
-from conftest import as_mapping, as_sequence, wrap_attrs
+from conftest import as_mapping, as_sequence, assert_valid, make_validator, wrap_attrs
 
 from zarr_cm import uom
 from zarr_cm.uom import CMO, UomAttrs
 
-SCHEMA_PATH = Path(__file__).parent / "schemas" / "uom.json"
-SCHEMA = json.loads(SCHEMA_PATH.read_text())
+VALIDATOR = make_validator("uom.json")
 
 
 def test_insert_uom_with_unit() -> None:
@@ -72,27 +67,27 @@ def test_extract_preserves_other_conventions() -> None:
     assert remaining["zarr_conventions"] == [other_cmo]
 
 
-def test_roundtrip() -> None:
-    original_attrs = {"foo": "bar"}
-    data: UomAttrs = {"ucum": {"unit": "m/s2"}, "description": "Acceleration"}
-    inserted = uom.insert(original_attrs, data)
-    remaining, extracted = uom.extract(inserted)
-    assert remaining == original_attrs
-    assert extracted == data
+# Module-scoped so the insert runs once for all pure-read tests that share the
+# same attributes; such tests must not mutate the returned dict.
+@pytest.fixture(scope="module")
+def full_uom_inserted() -> dict[str, object]:
+    data: UomAttrs = {"ucum": {"unit": "kg", "version": "2.2"}, "description": "Mass"}
+    return uom.insert({}, data)
 
 
-def test_schema_validation_full() -> None:
-    data: UomAttrs = {"ucum": {"unit": "kg", "version": "2.2"}, "description": "Mass"}
-    result = uom.insert({}, data)
-    node = wrap_attrs(result)
-    jsonschema.validate(node, SCHEMA)
+@pytest.fixture(scope="module")
+def minimal_uom_inserted() -> dict[str, object]:
+    return uom.insert({}, {"ucum": {}})
 
 
-def test_schema_validation_minimal() -> None:
-    data: UomAttrs = {"ucum": {}}
-    result = uom.insert({}, data)
-    node = wrap_attrs(result)
-    jsonschema.validate(node, SCHEMA)
+def test_schema_validation_full(full_uom_inserted: dict[str, object]) -> None:
+    node = wrap_attrs(full_uom_inserted)
+    assert_valid(VALIDATOR, node)
+
+
+def test_schema_validation_minimal(minimal_uom_inserted: dict[str, object]) -> None:
+    node = wrap_attrs(minimal_uom_inserted)
+    assert_valid(VALIDATOR, node)
 
 
 def test_create_minimal() -> None: